@@ -1,5 +1,6 @@
 """The Tion component."""
 
+from datetime import timedelta
 import logging
 
 import voluptuous as vol
@@ -22,10 +23,19 @@ from .const import (
     DOMAIN,
     MAGICAIR_DEVICE,
     TION_API,
+    TION_COORDINATOR,
 )
+from .coordinator import TionDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Component device type and platforms for each tion device class
+DEVICE_TYPES = {Breezer: BREEZER_DEVICE, MagicAir: MAGICAIR_DEVICE}
+DEVICE_PLATFORMS = {
+    BREEZER_DEVICE: ("sensor", "climate"),
+    MAGICAIR_DEVICE: ("sensor",),
+}
+
 CONFIG_SCHEMA = vol.Schema(
     {
         DOMAIN: vol.Schema(
@@ -52,11 +62,12 @@ def create_api(user, password, interval, auth_fname):
 
 async def async_setup(hass: HomeAssistant, config):
     """Set up Tion Component."""
+    scan_interval: timedelta = config[DOMAIN][CONF_SCAN_INTERVAL]
     api = await hass.async_add_executor_job(
         create_api,
         config[DOMAIN][CONF_USERNAME],
         config[DOMAIN][CONF_PASSWORD],
-        (config[DOMAIN][CONF_SCAN_INTERVAL]).seconds,
+        scan_interval.total_seconds(),
         hass.config.path(config[DOMAIN][CONF_FILE_PATH]),
     )
 
@@ -65,32 +76,31 @@ async def async_setup(hass: HomeAssistant, config):
 
     hass.data[TION_API] = api
 
+    coordinator = TionDataUpdateCoordinator(hass, api, scan_interval)
+    await coordinator.async_refresh()
+    if not coordinator.last_update_success:
+        _LOGGER.error("Couldn't get devices from Tion API")
+        return False
+
+    hass.data[TION_COORDINATOR] = coordinator
+
     discovery_info = {}
-    devices = await hass.async_add_executor_job(api.get_devices)
+    # Devices were already fetched by the coordinator's first refresh
+    devices = coordinator.data.values()
     device: Breezer | MagicAir
     for device in devices:
-        if device.valid:
-            device_type = (
-                BREEZER_DEVICE
-                if type(device) == Breezer
-                else (MAGICAIR_DEVICE if type(device) == MagicAir else None)
-            )
-            if device_type:
-                if "sensor" not in discovery_info:
-                    discovery_info["sensor"] = []
-                discovery_info["sensor"].append(
-                    {"type": device_type, "guid": device.guid}
-                )
-                if device_type == BREEZER_DEVICE:
-                    if "climate" not in discovery_info:
-                        discovery_info["climate"] = []
-                    discovery_info["climate"].append(
-                        {"type": device_type, "guid": device.guid}
-                    )
-            else:
-                _LOGGER.info("Unused device %s", device)
-        else:
+        if not device.valid:
             _LOGGER.info("Skipped device %s, because of 'valid' property", device)
+            continue
+
+        device_type = DEVICE_TYPES.get(type(device))
+        if not device_type:
+            _LOGGER.info("Unused device %s", device)
+            continue
+
+        discovered = {"type": device_type, "guid": device.guid}
+        for platform in DEVICE_PLATFORMS[device_type]:
+            discovery_info.setdefault(platform, []).append(discovered)
 
     for device_type, devices in discovery_info.items():
         await discovery.async_load_platform(hass, device_type, DOMAIN, devices, config)
@@ -1,6 +1,10 @@
 """Support for Tion breezer heater."""
 
+import asyncio
+from copy import copy
+from functools import lru_cache
 import logging
+from operator import attrgetter
 
 from homeassistant.components.climate import (
     ATTR_HVAC_MODE,
@@ -14,10 +18,11 @@ from homeassistant.const import (
     ATTR_TEMPERATURE,
     MAJOR_VERSION,
     MINOR_VERSION,
-    STATE_UNKNOWN,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from tion import Breezer, Zone
 
 from .const import (
@@ -25,177 +30,185 @@ from .const import (
     SWING_INSIDE,
     SWING_MIXED,
     SWING_OUTSIDE,
-    TION_API,
+    TION_COORDINATOR,
 )
+from .coordinator import TionDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+_HA_SUPPORTS_TURN_ON_OFF = (MAJOR_VERSION, MINOR_VERSION) >= (2024, 2)
+_BASE_FEATURES = ClimateEntityFeature.FAN_MODE | ClimateEntityFeature.SWING_MODE
+if _HA_SUPPORTS_TURN_ON_OFF:
+    _BASE_FEATURES |= ClimateEntityFeature.TURN_OFF | ClimateEntityFeature.TURN_ON
+
+# Seconds to wait for more changes before sending them to the breezer
+_SEND_DELAY = 0.1
+
+# Air gate position by breezer type: 0 - outside, 1 - mixed (inside for 4S),
+# 2 - inside
+_GATE_TO_SWING = {
+    ("breezer3", 0): SWING_OUTSIDE,
+    ("breezer3", 1): SWING_MIXED,
+    ("breezer3", 2): SWING_INSIDE,
+    ("breezer4", 0): SWING_OUTSIDE,
+    ("breezer4", 1): SWING_INSIDE,
+    ("breezer4", 2): SWING_INSIDE,
+}
+_SWING_TO_GATE = {
+    ("breezer3", SWING_OUTSIDE): 0,
+    ("breezer3", SWING_MIXED): 1,
+    ("breezer3", SWING_INSIDE): 2,
+    ("breezer4", SWING_OUTSIDE): 0,
+    ("breezer4", SWING_MIXED): 1,
+    ("breezer4", SWING_INSIDE): 1,
+}
+
+
+@lru_cache(maxsize=16)
+def _fan_modes_for(speed_limit: int) -> tuple[str, ...]:
+    """Return fan modes for a breezer with the given speed limit."""
+    return (FAN_OFF, FAN_AUTO, *(str(speed) for speed in range(speed_limit + 1)))
+
+
+@lru_cache(maxsize=8)
+def _modes_for(
+    breezer_type: str, heater_installed: bool
+) -> tuple[tuple[HVACMode, ...], tuple[str, ...]]:
+    """Return hvac and swing modes for a breezer type."""
+    hvac_modes = (HVACMode.OFF, HVACMode.FAN_ONLY)
+    if heater_installed:
+        hvac_modes += (HVACMode.HEAT,)
+    swing_modes = (SWING_OUTSIDE, SWING_INSIDE)
+    if breezer_type != "breezer4":
+        swing_modes += (SWING_MIXED,)
+    return hvac_modes, swing_modes
+
+
+# Breezer and zone fields that are sent to Tion API
+_breezer_state = attrgetter(
+    "heater_enabled", "t_set", "speed", "speed_min_set", "speed_max_set", "gate"
+)
+_zone_state = attrgetter("mode", "target_co2")
+
+
+def _copy_breezer(breezer: Breezer) -> Breezer:
+    """Return a copy of the breezer and its zone to apply local changes to."""
+    breezer = copy(breezer)
+    breezer.zone = copy(breezer.zone)
+    return breezer
+
+
+# Breezer and zone fields exposed as state attributes
+_ZONE_ATTRS = ("mode", "target_co2")
+_BREEZER_ATTRS = (
+    "speed",
+    "speed_min_set",
+    "speed_max_set",
+    "filter_need_replace",
+    "t_in",
+)
+_get_zone_attrs = attrgetter(*_ZONE_ATTRS)
+_get_breezer_attrs = attrgetter(*_BREEZER_ATTRS)
+
 
 async def async_setup_platform(
     hass: HomeAssistant, config, async_add_entities, discovery_info=None
 ):
     """Set up Tion climate platform."""
-    tion = hass.data[TION_API]
+    coordinator = hass.data[TION_COORDINATOR]
     if discovery_info is None:
         return
-    devices = [TionClimate(tion, device["guid"]) for device in discovery_info]
+    async_add_entities(
+        TionClimate(coordinator, device["guid"]) for device in discovery_info
+    )
 
-    async_add_entities(devices)
 
-
-class TionClimate(ClimateEntity):
+class TionClimate(CoordinatorEntity, ClimateEntity):
     """Tion climate devices,include air conditioner,heater."""
 
+    # Home Assistant base classes keep their own __dict__ for _attr_* values
+    __slots__ = (
+        "_breezer",
+        "_breezer_guid",
+        "_breezer_type",
+        "_known_breezer_state",
+        "_known_zone_state",
+        "_last_fan_speed_synced",
+        "_pending_breezer",
+        "_pending_zone",
+        "_send_lock",
+        "_unsub_send",
+        "_zone",
+    )
+
+    _attr_icon = "mdi:air-filter"
+    _attr_target_temperature_step = 1
+    _attr_temperature_unit = UnitOfTemperature.CELSIUS
     _attr_translation_key = "tion_breezer"
+    _enable_turn_on_off_backwards_compatibility = False
 
-    def __init__(self, tion, guid) -> None:
+    def __init__(self, coordinator: TionDataUpdateCoordinator, guid: str) -> None:
         """Init climate device."""
-        self._breezer: Breezer = tion.get_devices(guid=guid)[0]
-        self._zone: Zone = tion.get_zones(guid=self._breezer.zone.guid)[0]
-        self._last_fan_speed_synced = None
-
-        self._attr_supported_features = (
-            ClimateEntityFeature.FAN_MODE | ClimateEntityFeature.SWING_MODE
+        super().__init__(coordinator)
+        self._breezer_guid: str = guid
+        self._set_breezer(coordinator.data[guid])
+        self._last_fan_speed_synced: str | None = None
+        self._pending_breezer: bool = False
+        self._pending_zone: bool = False
+        self._send_lock = asyncio.Lock()
+        self._unsub_send: CALLBACK_TYPE | None = None
+        self._attr_unique_id = guid
+        self._attr_name = self._breezer.name
+        self._breezer_type: str = (
+            "breezer4" if "4S" in self._breezer.name else "breezer3"
         )
+
+        self._attr_supported_features = _BASE_FEATURES
         if self._breezer.heater_installed:
             self._attr_supported_features |= ClimateEntityFeature.TARGET_TEMPERATURE
 
-        if (MAJOR_VERSION, MINOR_VERSION) >= (2024, 2):
-            self._enable_turn_on_off_backwards_compatibility = False
-            self._attr_supported_features |= ClimateEntityFeature.TURN_OFF
-            self._attr_supported_features |= ClimateEntityFeature.TURN_ON
-
-    @property
-    def temperature_unit(self):
-        """Return the unit of measurement used by the platform."""
-        return UnitOfTemperature.CELSIUS
-
-    @property
-    def unique_id(self):
-        """Return a unique id identifying the entity."""
-        return self._breezer.guid
-
-    @property
-    def name(self):
-        """Return the name of the breezer."""
-        return f"{self._breezer.name}"
+        self._attr_hvac_modes, self._attr_swing_modes = _modes_for(
+            self._breezer_type, bool(self._breezer.heater_installed)
+        )
+        self._update_attrs()
 
     @property
     def type(self):
         """Return the type of the breezer."""
-        return "breezer4" if "4S" in self.name else "breezer3"
+        return self._breezer_type
 
     @property
-    def hvac_mode(self):
-        """Return current operation."""
-        if self._breezer.valid:
-            if self._zone.mode == "manual" and not self._breezer.is_on:
-                return HVACMode.OFF
-
-            if self._breezer.heater_enabled:
-                return HVACMode.HEAT
-
-            return HVACMode.FAN_ONLY
-
-        return STATE_UNKNOWN
-
-    @property
-    def hvac_modes(self):
-        """Return the list of available operation modes."""
-        _operations = [HVACMode.OFF, HVACMode.FAN_ONLY]
-        if self._breezer.heater_installed:
-            _operations.append(HVACMode.HEAT)
-        return _operations
-
-    @property
-    def current_temperature(self):
+    def current_temperature(self) -> float | None:
         """Return the current temperature."""
-        return self._breezer.t_out if self._breezer.valid else STATE_UNKNOWN
+        return self._breezer.t_out
 
     @property
-    def target_temperature(self):
+    def target_temperature(self) -> float | None:
         """Return the temperature we try to reach."""
-        return self._breezer.t_set if self._breezer.valid else STATE_UNKNOWN
-
-    @property
-    def target_temperature_step(self):
-        """Return the supported step of target temperature."""
-        return 1
-
-    @property
-    def fan_mode(self):
-        """Return the fan setting."""
-        if self._zone.mode == "auto":
-            return FAN_AUTO
-
-        if not self._breezer.is_on:
-            return FAN_OFF
-
-        fan_speed = str(int(self._breezer.speed))
-        self._last_fan_speed_synced = fan_speed
-
-        return fan_speed
-
-    @property
-    def fan_modes(self):
-        """Return the list of available fan modes."""
-        _fan_modes = [FAN_OFF, FAN_AUTO]
-        try:
-            _fan_modes.extend(range(int(self._breezer.speed_limit) + 1))
-        except AttributeError:
-            _fan_modes.extend(range(7))
-            _LOGGER.info(
-                "Breezer.speed_limit is %s, fan_modes set to 0-6",
-                self._breezer.speed_limit,
-            )
-        return [str(m) for m in _fan_modes]
-
-    @property
-    def swing_mode(self):
-        """Return the swing mode. It's 3 type: inside, outside, mixed."""
-        if self._breezer.gate == 0:
-            _swing_mode = SWING_OUTSIDE
-        elif self._breezer.gate == 1:
-            if self.type == "breezer4":
-                _swing_mode = SWING_INSIDE
-            else:
-                _swing_mode = SWING_MIXED
-        elif self._breezer.gate == 2:
-            _swing_mode = SWING_INSIDE
-        else:
-            _swing_mode = STATE_UNKNOWN
-
-        return _swing_mode
+        return self._breezer.t_set
 
-    @property
-    def swing_modes(self):
-        """Return the list of available preset modes."""
-        _swing_modes = [SWING_OUTSIDE, SWING_INSIDE]
-        if self.type != "breezer4":
-            _swing_modes.append(SWING_MIXED)
-
-        return [str(m) for m in _swing_modes]
-
-    def turn_on(self) -> None:
+    async def async_turn_on(self) -> None:
         """Turn breezer on."""
         if self._breezer.heater_enabled and self._breezer.heater_installed:
-            self.set_hvac_mode(HVACMode.HEAT)
+            await self.async_set_hvac_mode(HVACMode.HEAT)
         else:
-            self.set_hvac_mode(HVACMode.FAN_ONLY)
+            await self.async_set_hvac_mode(HVACMode.FAN_ONLY)
 
-    def turn_off(self) -> None:
+    async def async_turn_off(self) -> None:
         """Turn breezer off."""
-        self.set_hvac_mode(HVACMode.OFF)
+        await self.async_set_hvac_mode(HVACMode.OFF)
 
-    def set_temperature(self, **kwargs):
+    async def async_set_temperature(self, **kwargs) -> None:
         """Set new target temperature."""
         if ATTR_TEMPERATURE in kwargs:
-            self._breezer.t_set = int(kwargs[ATTR_TEMPERATURE])
-            self._breezer.send()
+            t_set = int(kwargs[ATTR_TEMPERATURE])
+            if self._breezer.t_set != t_set:
+                self._breezer.t_set = t_set
+                self._async_schedule_send(breezer=True)
         if ATTR_HVAC_MODE in kwargs:
-            self.set_hvac_mode(kwargs[ATTR_HVAC_MODE])
+            await self.async_set_hvac_mode(kwargs[ATTR_HVAC_MODE])
 
-    def set_fan_mode(self, fan_mode):
+    async def async_set_fan_mode(self, fan_mode: str) -> None:
         """Set new target fan mode."""
         new_mode = "manual"
         new_speed = None
@@ -208,129 +221,206 @@ class TionClimate(ClimateEntity):
         if self._zone.mode != new_mode:
             _LOGGER.info("Setting zone mode to %s", new_mode)
             self._zone.mode = new_mode
-            self._zone.send()
-        if new_mode == "manual" and new_speed is not None:
+            self._async_schedule_send(zone=True)
+        if (
+            new_mode == "manual"
+            and new_speed is not None
+            and self._breezer.speed != new_speed
+        ):
             _LOGGER.info("Setting breezer fan_mode to %s", new_speed)
             self._breezer.speed = new_speed
-            self._breezer.send()
+            self._async_schedule_send(breezer=True)
 
-    def set_hvac_mode(self, hvac_mode):
+    async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new target operation mode."""
         _LOGGER.info("Setting hvac mode to %s", hvac_mode)
         if hvac_mode == HVACMode.OFF:
-            self.set_fan_mode(FAN_OFF)
+            await self.async_set_fan_mode(FAN_OFF)
         else:
-            if hvac_mode == HVACMode.HEAT:
-                self._breezer.heater_enabled = True
-                self._breezer.send()
-            elif hvac_mode == HVACMode.FAN_ONLY:
-                self._breezer.heater_enabled = False
-                self._breezer.send()
+            heater_enabled = hvac_mode == HVACMode.HEAT
+            if self._breezer.heater_enabled != heater_enabled:
+                self._breezer.heater_enabled = heater_enabled
+                self._async_schedule_send(breezer=True)
             if self.hvac_mode == HVACMode.OFF:
-                self.set_fan_mode(
+                await self.async_set_fan_mode(
                     self._last_fan_speed_synced
                     if self._last_fan_speed_synced is not None
                     else "1"
                 )
 
-    def set_swing_mode(self, swing_mode: str) -> None:
+    async def async_set_swing_mode(self, swing_mode: str) -> None:
         """Set Tion breezer air gate."""
-        if swing_mode == SWING_OUTSIDE:
-            self._breezer.gate = 0
-        elif swing_mode == SWING_MIXED:
-            self._breezer.gate = 1
-        elif swing_mode == SWING_INSIDE:
-            self._breezer.gate = 1 if self.type == "breezer4" else 2
-        else:
-            self._breezer.gate = 1
+        gate = _SWING_TO_GATE.get((self._breezer_type, swing_mode), 1)
+        if self._breezer.gate == gate:
+            return
+
+        self._breezer.gate = gate
         _LOGGER.info(
             "Device: %s Swing mode changed to %s", self._breezer.name, swing_mode
         )
 
         if self.hvac_mode != HVACMode.OFF:
-            self.set_fan_mode(
+            await self.async_set_fan_mode(
                 self._last_fan_speed_synced
                 if self._last_fan_speed_synced is not None
                 else "1"
             )
-        self._breezer.send()
-        self._breezer.load()
-
-    def update(self):
-        """Fetch new state data for the breezer.
+        self._async_schedule_send(breezer=True)
+
+    @callback
+    def _async_schedule_send(self, breezer: bool = False, zone: bool = False) -> None:
+        """Queue breezer and/or zone data to be sent together."""
+        self._pending_breezer |= breezer
+        self._pending_zone |= zone
+        if self._unsub_send is not None:
+            self._unsub_send()
+        self._unsub_send = async_call_later(self.hass, _SEND_DELAY, self._async_send)
+        # Show the new state right away instead of waiting for the next refresh
+        self._update_attrs()
+        self.async_write_ha_state()
+
+    async def _async_send(self, _now=None) -> None:
+        """Send all pending changes with one request per zone and breezer."""
+        self._unsub_send = None
+        # Changes queued during a send go out after it, with the newest state
+        async with self._send_lock:
+            if not await self._async_send_pending():
+                return
+        await self.coordinator.async_request_refresh()
+
+    async def _async_send_pending(self) -> bool:
+        """Send pending zone and breezer data, return False if nothing was sent."""
+        zone_state = _zone_state(self._zone)
+        breezer_state = _breezer_state(self._breezer)
+        # Skip writes that would not change the last known device state
+        zone = (
+            self._zone
+            if self._pending_zone and zone_state != self._known_zone_state
+            else None
+        )
+        breezer = (
+            self._breezer
+            if self._pending_breezer and breezer_state != self._known_breezer_state
+            else None
+        )
+        self._pending_breezer = False
+        self._pending_zone = False
+        if zone is None and breezer is None:
+            _LOGGER.debug("%s: nothing changed, skip sending", self.name)
+            return False
+
+        zone_sent, breezer_sent = await self.hass.async_add_executor_job(
+            self._send, zone, breezer
+        )
+        # Remember what was sent, the refresh after it may wait for the cooldown
+        if zone is not None and zone_sent:
+            self._known_zone_state = zone_state
+        if breezer is not None and breezer_sent:
+            self._known_breezer_state = breezer_state
+        if not (zone_sent and breezer_sent):
+            _LOGGER.error("%s: couldn't send new state to Tion API", self.name)
+            # Drop unsent changes unless newer ones are queued to be sent
+            if (
+                self._unsub_send is None
+                and not (self._pending_breezer or self._pending_zone)
+                and (data := self.coordinator.data.get(self._breezer_guid)) is not None
+            ):
+                self._set_breezer(data)
+                self._update_attrs()
+                self.async_write_ha_state()
+        return True
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Send pending changes before the entity is removed."""
+        if self._unsub_send is not None:
+            self._unsub_send()
+            await self._async_send()
+        await super().async_will_remove_from_hass()
+
+    @staticmethod
+    def _send(zone: Zone | None, breezer: Breezer | None) -> tuple[bool, bool]:
+        """Send zone and breezer data to Tion API, return which were sent."""
+        zone_sent = zone is None or zone.send()
+        breezer_sent = breezer is None or breezer.send()
+        return zone_sent, breezer_sent
+
+    def _set_breezer(self, breezer: Breezer) -> None:
+        """Use coordinator breezer data as the last known device state."""
+        # Local changes go to a copy, so coordinator data stays as fetched
+        self._breezer = _copy_breezer(breezer)
+        self._zone = self._breezer.zone
+        self._known_breezer_state = _breezer_state(breezer)
+        self._known_zone_state = _zone_state(breezer.zone)
+
+    def _update_attrs(self) -> None:
+        """Compute state attributes once per breezer data update."""
+        breezer = self._breezer
+        zone = self._zone
+        # Breezer.load sets speed to 0 when off and Breezer.send turns it off
+        # for speed 0, so speed also reflects changes that are not sent yet
+        speed = breezer.speed
+        is_on = bool(speed)
+        self._attr_available = breezer.valid and zone.valid
+        if not breezer.valid:
+            self._attr_hvac_mode = None
+        elif zone.mode == "manual" and not is_on:
+            self._attr_hvac_mode = HVACMode.OFF
+        elif breezer.heater_enabled:
+            self._attr_hvac_mode = HVACMode.HEAT
+        else:
+            self._attr_hvac_mode = HVACMode.FAN_ONLY
 
-        This is the only method that should fetch new data for Home Assistant.
-        """
-        self._zone.load()
-        self._breezer.load()
+        if zone.mode == "auto":
+            self._attr_fan_mode = FAN_AUTO
+        elif not is_on:
+            self._attr_fan_mode = FAN_OFF
+        else:
+            self._attr_fan_mode = str(int(speed))
+            self._last_fan_speed_synced = self._attr_fan_mode
 
-    @property
-    def mode(self) -> str:
-        """Return the current mode."""
-        return self._zone.mode if self._zone.valid else STATE_UNKNOWN
+        speed_limit = breezer.speed_limit
+        try:
+            self._attr_fan_modes = _fan_modes_for(int(speed_limit))
+        except (TypeError, ValueError):
+            self._attr_fan_modes = _fan_modes_for(6)
+            _LOGGER.debug(
+                "Breezer.speed_limit is %s, fan_modes set to 0-6", speed_limit
+            )
 
-    @property
-    def target_co2(self) -> str:
-        """Return the current mode."""
-        return self._zone.target_co2 if self._zone.valid else STATE_UNKNOWN
+        self._attr_swing_mode = _GATE_TO_SWING.get((self._breezer_type, breezer.gate))
+
+        attrs = dict(zip(_ZONE_ATTRS, _get_zone_attrs(zone)))
+        attrs.update(zip(_BREEZER_ATTRS, _get_breezer_attrs(breezer)))
+        attrs[LAST_FAN_SPEED_SYNCED] = self._last_fan_speed_synced
+        self._attr_extra_state_attributes = attrs
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        # Keep local changes that are waiting to be sent or being sent, and
+        # don't let old devices served during an outage replace sent state
+        if (
+            self._unsub_send is None
+            and not (self._pending_breezer or self._pending_zone)
+            and not self._send_lock.locked()
+            and not self.coordinator.stale
+            and (breezer := self.coordinator.data.get(self._breezer_guid)) is not None
+        ):
+            self._set_breezer(breezer)
+        self._update_attrs()
+        super()._handle_coordinator_update()
 
     @property
-    def min_temp(self):
+    def min_temp(self) -> float | None:
         """Return the minimum temperature."""
-        return self._breezer.t_min if self._breezer.valid else STATE_UNKNOWN
+        return self._breezer.t_min
 
     @property
-    def max_temp(self):
+    def max_temp(self) -> float | None:
         """Return the maximum temperature."""
-        return self._breezer.t_max if self._breezer.valid else STATE_UNKNOWN
-
-    @property
-    def speed(self) -> str:
-        """Return the current speed."""
-        return self._breezer.speed if self._breezer.valid else STATE_UNKNOWN
-
-    @property
-    def speed_min_set(self) -> str:
-        """Return the minimum speed for auto mode."""
-        return self._breezer.speed_min_set if self._breezer.valid else STATE_UNKNOWN
-
-    @property
-    def speed_max_set(self) -> str:
-        """Return the maximum speed for auto mode."""
-        return self._breezer.speed_max_set if self._breezer.valid else STATE_UNKNOWN
-
-    @property
-    def filter_need_replace(self) -> str:
-        """Return filter_need_replace input_boolean."""
-        return (
-            self._breezer.filter_need_replace if self._breezer.valid else STATE_UNKNOWN
-        )
-
-    @property
-    def t_in(self) -> str:
-        """Return filter_need_replace input_boolean."""
-        return self._breezer.t_in if self._breezer.valid else STATE_UNKNOWN
-
-    @property
-    def state_attributes(self) -> dict:
-        """Return optional state attributes."""
-        data = super().state_attributes
-        data["mode"] = self.mode
-        data["target_co2"] = self.target_co2
-        data["speed"] = self.speed
-        data["speed_min_set"] = self.speed_min_set
-        data["speed_max_set"] = self.speed_max_set
-        data["filter_need_replace"] = self.filter_need_replace
-        data["t_in"] = self.t_in
-        data[LAST_FAN_SPEED_SYNCED] = self._last_fan_speed_synced
-        return data
-
-    @property
-    def icon(self):
-        """Return the entity picture to use in the frontend, if any."""
-        return "mdi:air-filter"
+        return self._breezer.t_max
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return self._breezer.valid and self._zone.valid
+        return super().available and self._attr_available
@@ -4,6 +4,7 @@ from datetime import timedelta
 
 DOMAIN = "tion"
 TION_API = "data_tion"
+TION_COORDINATOR = "coordinator_tion"
 DEFAULT_AUTH_FILENAME = "tion_auth"
 DEFAULT_SCAN_INTERVAL = timedelta(minutes=1)
 
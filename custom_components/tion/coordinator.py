@@ -0,0 +1,51 @@
+"""Data update coordinator for the Tion component."""
+
+from datetime import timedelta
+import logging
+from time import monotonic
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from tion import Breezer, MagicAir, TionApi
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds to keep serving the last fetched devices while Tion API is unreachable,
+# extended to two update intervals so at least one failed poll is covered
+_STALE_DATA_MAX_AGE = 120
+
+
+class TionDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Breezer | MagicAir]]):
+    """Fetch all Tion devices and zones once per update interval."""
+
+    def __init__(
+        self, hass: HomeAssistant, api: TionApi, update_interval: timedelta
+    ) -> None:
+        """Initialize Tion data update coordinator."""
+        super().__init__(hass, _LOGGER, name=DOMAIN, update_interval=update_interval)
+        self.api = api
+        self._last_fetch: float = 0.0
+        self._stale_data_max_age: float = max(
+            _STALE_DATA_MAX_AGE, 2 * update_interval.total_seconds()
+        )
+        # True while the last devices are served because Tion API is unreachable
+        self.stale: bool = False
+
+    def _get_devices(self) -> dict[str, Breezer | MagicAir]:
+        """Return devices by guid, fetched with a single location request."""
+        if not self.api.get_data(force=True):
+            if self.data and monotonic() - self._last_fetch < self._stale_data_max_age:
+                _LOGGER.debug("Couldn't get data from Tion API, keep last devices")
+                self.stale = True
+                return self.data
+            raise UpdateFailed("Couldn't get data from Tion API")
+
+        self._last_fetch = monotonic()
+        self.stale = False
+        return {device.guid: device for device in self.api.get_devices()}
+
+    async def _async_update_data(self) -> dict[str, Breezer | MagicAir]:
+        """Fetch data from Tion API."""
+        return await self.hass.async_add_executor_job(self._get_devices)